@@ -12,16 +12,30 @@ Usage:
 """
 
 import os
+import re
+import errno
 import sys
 import json
+import time
+import filecmp
+import queue
+import atexit
+import tempfile
+import threading
+import subprocess
+import mmap
 import shutil
 import argparse
 import mimetypes
 from pathlib import Path
+from stat import S_ISREG
 from datetime import datetime
-from typing import Optional, Dict, List, Callable
+from collections import deque
+from typing import Optional, Dict, List, Callable, Tuple, Deque, Set
 from dataclasses import dataclass, asdict
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 
 # Content extraction
@@ -37,6 +51,192 @@ try:
 except ImportError:
     HAS_TESSERACT = False
 
+# SIMD-accelerated content hashing
+try:
+    from blake3 import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+# Multi-pattern substring search
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Faster JSON serialization for the history log
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Bytes hashed from each end of a file
+SAMPLE_SIZE = 8192
+
+# Don't update access times just for hashing (Linux only)
+O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+# Files stat'ed and hashed per prefetch round, and threads doing it
+PREFETCH_BATCH = 256
+PREFETCH_WORKERS = 16
+
+# (stat, content hash) gathered for a file ahead of analysis
+Prefetched = Tuple[os.stat_result, str]
+
+# Cached content hashes kept between runs
+HASH_CACHE_LIMIT = 10000
+
+# Recorded in hash cache keys so digests from different algorithms never mix
+HASH_ALGORITHM = 'blake3' if HAS_BLAKE3 else 'blake2b'
+
+# History records kept in memory and when the log is rotated
+HISTORY_LIMIT = 100
+
+# Flush the history log every N records; rotate it once it grows past this
+LOG_FLUSH_EVERY = 50
+LOG_ROTATE_BYTES = 1 << 20
+
+# Seconds a watched file must go without events before it is organized
+DEBOUNCE_SECONDS = 0.5
+
+# Separates per-image output when tesseract OCRs a list of images
+OCR_PAGE_SEPARATOR = '\x1f'
+
+# PDF text objects and the string literals inside them
+_BT_ET_RE = re.compile(rb'\bBT\b(.*?)\bET\b', re.DOTALL)
+_PAREN_RE = re.compile(rb'\(([^)\\]+)\)')
+
+# Text objects sit near the start of most PDFs; don't scan past this
+PDF_SCAN_LIMIT = 1 << 20
+
+# MIME types for every categorized extension, independent of the system's
+# mime.types; mimetypes is only consulted for anything else
+_EXT_TO_MIME = {
+    # Documents
+    '.pdf': 'application/pdf',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.odt': 'application/vnd.oasis.opendocument.text',
+    '.rtf': 'application/rtf',
+    '.tex': 'application/x-tex',
+    '.txt': 'text/plain',
+    '.md': 'text/markdown',
+    # Spreadsheets
+    '.xls': 'application/vnd.ms-excel',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    '.ods': 'application/vnd.oasis.opendocument.spreadsheet',
+    '.csv': 'text/csv',
+    '.tsv': 'text/tab-separated-values',
+    # Presentations
+    '.ppt': 'application/vnd.ms-powerpoint',
+    '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    '.odp': 'application/vnd.oasis.opendocument.presentation',
+    '.key': 'application/vnd.apple.keynote',
+    # Images
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.bmp': 'image/bmp',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/vnd.microsoft.icon',
+    # Videos
+    '.mp4': 'video/mp4',
+    '.avi': 'video/x-msvideo',
+    '.mov': 'video/quicktime',
+    '.mkv': 'video/x-matroska',
+    '.webm': 'video/webm',
+    '.flv': 'video/x-flv',
+    # Audio
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/x-wav',
+    '.flac': 'audio/flac',
+    '.aac': 'audio/aac',
+    '.ogg': 'audio/ogg',
+    '.m4a': 'audio/mp4',
+    # Archives
+    '.zip': 'application/zip',
+    '.tar': 'application/x-tar',
+    '.gz': 'application/gzip',
+    '.bz2': 'application/x-bzip2',
+    '.7z': 'application/x-7z-compressed',
+    '.rar': 'application/vnd.rar',
+    '.xz': 'application/x-xz',
+    # Code
+    '.py': 'text/x-python',
+    '.js': 'text/javascript',
+    '.ts': 'text/x-typescript',
+    '.java': 'text/x-java',
+    '.cpp': 'text/x-c++src',
+    '.c': 'text/x-c',
+    '.h': 'text/x-chdr',
+    '.go': 'text/x-go',
+    '.rs': 'text/x-rust',
+    '.rb': 'text/x-ruby',
+    '.php': 'application/x-httpd-php',
+    # Web
+    '.html': 'text/html',
+    '.htm': 'text/html',
+    '.css': 'text/css',
+    '.scss': 'text/x-scss',
+    '.sass': 'text/x-sass',
+    '.less': 'text/x-less',
+    # Data
+    '.json': 'application/json',
+    '.xml': 'application/xml',
+    '.yaml': 'application/yaml',
+    '.yml': 'application/yaml',
+    '.sql': 'application/sql',
+    '.db': 'application/vnd.sqlite3',
+    # Executables
+    '.exe': 'application/vnd.microsoft.portable-executable',
+    '.msi': 'application/x-msi',
+    '.dmg': 'application/x-apple-diskimage',
+    '.pkg': 'application/vnd.apple.installer+xml',
+    '.deb': 'application/vnd.debian.binary-package',
+    '.rpm': 'application/x-rpm',
+    '.appimage': 'application/x-iso9660-appimage',
+    # Fonts
+    '.ttf': 'font/ttf',
+    '.otf': 'font/otf',
+    '.woff': 'font/woff',
+    '.woff2': 'font/woff2',
+    '.eot': 'application/vnd.ms-fontobject',
+    # Ebooks
+    '.epub': 'application/epub+zip',
+    '.mobi': 'application/x-mobipocket-ebook',
+    '.azw': 'application/vnd.amazon.ebook',
+    '.azw3': 'application/vnd.amazon.mobi8-ebook',
+}
+
+# Load the system MIME tables once, up front
+mimetypes.init()
+
+
+@lru_cache(maxsize=1024)
+def _guess_mime_type(ext: str) -> str:
+    """Guess a MIME type from a lowercase file extension."""
+    mime_type = _EXT_TO_MIME.get(ext)
+    if mime_type is None:
+        mime_type, _ = mimetypes.guess_type('file' + ext, strict=False)
+    return mime_type or 'application/octet-stream'
+
+
+def _substring_matcher(patterns: List[str]) -> Callable[[str], bool]:
+    """Build a one-pass test for whether text contains any of the patterns."""
+    if HAS_AHOCORASICK:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    regex = re.compile('|'.join(map(re.escape, patterns)))
+    return lambda text: regex.search(text) is not None
+
 
 @dataclass
 class FileInfo:
@@ -45,8 +245,8 @@ class FileInfo:
     size: int
     mime_type: str
     extension: str
-    created: datetime
-    modified: datetime
+    created: float  # Timestamps, formatted only when serialized
+    modified: float
     content_hash: str
     extracted_text: Optional[str] = None
     category: Optional[str] = None
@@ -57,96 +257,111 @@ class FileInfo:
             'size': self.size,
             'mime_type': self.mime_type,
             'extension': self.extension,
-            'created': self.created.isoformat(),
-            'modified': self.modified.isoformat(),
+            'created': datetime.fromtimestamp(self.created).isoformat(),
+            'modified': datetime.fromtimestamp(self.modified).isoformat(),
             'content_hash': self.content_hash,
             'category': self.category,
         }
 
 
+# Image types worth running OCR on
+OCR_MIME_TYPES = ('image/png', 'image/jpeg', 'image/webp', 'image/gif')
+
+
+def _extract_text(path: Path) -> Optional[str]:
+    """Extract text from a text file."""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read(5000)  # First 5000 chars, without reading the rest
+    except Exception:
+        return None
+
+
+def _extract_image_text(path: Path) -> Optional[str]:
+    """Extract text from image using OCR."""
+    if not HAS_PIL or not HAS_TESSERACT:
+        return None
+    try:
+        image = Image.open(path)
+        return pytesseract.image_to_string(image)[:2000]
+    except Exception:
+        return None
+
+
+def _extract_pdf_text(path: Path) -> Optional[str]:
+    """Extract text from PDF."""
+    # Basic PDF text extraction without external deps
+    try:
+        with open(path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = min(len(mm), PDF_SCAN_LIMIT)
+            parts = []
+            for match in _BT_ET_RE.finditer(mm, 0, end):
+                parts.extend(_PAREN_RE.findall(match.group(1)))
+            # No text objects found, take any string literals instead
+            if not parts:
+                parts = _PAREN_RE.findall(mm, 0, end)
+            if not parts:
+                return None
+            return b' '.join(parts).decode('latin-1')[:5000]
+    except Exception:
+        return None
+
+
+_EXTRACTORS: Dict[str, Callable[[Path], Optional[str]]] = {
+    'text/plain': _extract_text,
+    'text/markdown': _extract_text,
+    'text/html': _extract_text,
+    'text/css': _extract_text,
+    'text/javascript': _extract_text,
+    'application/json': _extract_text,
+    'application/xml': _extract_text,
+    'application/pdf': _extract_pdf_text,
+    **{mime_type: _extract_image_text for mime_type in OCR_MIME_TYPES},
+}
+
+# Text files whose MIME type has no extractor of its own
+_EXTENSION_EXTRACTORS: Dict[str, Callable[[Path], Optional[str]]] = {
+    ext: _extract_text
+    for ext in ('.txt', '.md', '.json', '.xml', '.yaml', '.yml',
+                '.csv', '.log', '.py', '.js', '.html', '.css',
+                '.sh', '.bash', '.zsh', '.conf', '.cfg', '.ini')
+}
+
+
 class ContentExtractor:
     """Extracts meaningful content from various file types."""
     
-    def __init__(self):
-        self.extractors: Dict[str, Callable[[Path], Optional[str]]] = {
-            'text/plain': self._extract_text,
-            'text/markdown': self._extract_text,
-            'text/html': self._extract_text,
-            'text/css': self._extract_text,
-            'text/javascript': self._extract_text,
-            'application/json': self._extract_text,
-            'application/xml': self._extract_text,
-            'image/png': self._extract_image_text,
-            'image/jpeg': self._extract_image_text,
-            'image/webp': self._extract_image_text,
-            'image/gif': self._extract_image_text,
-            'application/pdf': self._extract_pdf_text,
-        }
+    extractors = _EXTRACTORS
     
     def extract(self, path: Path, mime_type: str) -> Optional[str]:
         """Extract text content from a file."""
-        # Try specific extractor
-        if mime_type in self.extractors:
-            return self.extractors[mime_type](path)
-        
-        # Try by extension for text files
-        ext = path.suffix.lower()
-        text_extensions = {'.txt', '.md', '.json', '.xml', '.yaml', '.yml', 
-                          '.csv', '.log', '.py', '.js', '.html', '.css', 
-                          '.sh', '.bash', '.zsh', '.conf', '.cfg', '.ini'}
-        if ext in text_extensions:
-            return self._extract_text(path)
-        
+        # Try specific extractor, then by extension for text files
+        extractor = (_EXTRACTORS.get(mime_type)
+                     or _EXTENSION_EXTRACTORS.get(path.suffix.lower()))
+        if extractor:
+            return extractor(path)
         return None
     
-    def _extract_text(self, path: Path) -> Optional[str]:
-        """Extract text from a text file."""
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                return f.read()[:5000]  # First 5000 chars
-        except Exception:
-            return None
-    
-    def _extract_image_text(self, path: Path) -> Optional[str]:
-        """Extract text from image using OCR."""
-        if not HAS_PIL or not HAS_TESSERACT:
-            return None
-        try:
-            image = Image.open(path)
-            return pytesseract.image_to_string(image)[:2000]
-        except Exception:
-            return None
-    
-    def _extract_pdf_text(self, path: Path) -> Optional[str]:
-        """Extract text from PDF."""
-        # Basic PDF text extraction without external deps
-        try:
-            with open(path, 'rb') as f:
-                content = f.read()
-                # Look for text streams in PDF
-                text = b''
-                in_text = False
-                for i in range(len(content) - 5):
-                    if content[i:i+5] == b'BT\n\n':  # Begin text
-                        in_text = True
-                    elif content[i:i+4] == b'ET\n':  # End text
-                        in_text = False
-                    elif in_text and content[i:i+2] == b'(':
-                        # Extract text between parentheses
-                        end = content.find(b')', i)
-                        if end > i:
-                            text += content[i+1:end] + b' '
-                
-                # Also try to find raw text
-                decoded = content.decode('latin-1', errors='ignore')
-                # Look for common PDF text patterns
-                import re
-                text_parts = re.findall(r'\(([^\)]+)\)', decoded)
-                if text_parts:
-                    return ' '.join(text_parts)[:5000]
-                return text.decode('latin-1', errors='ignore')[:5000] if text else None
-        except Exception:
-            return None
+    def extract_image_texts(self, paths: List[Path]) -> List[Optional[str]]:
+        """Extract text from many images with a single tesseract process."""
+        if HAS_PIL and HAS_TESSERACT and not any('\n' in str(p) for p in paths):
+            try:
+                with tempfile.NamedTemporaryFile('w', suffix='.txt') as listing:
+                    listing.write(''.join(f"{p}\n" for p in paths))
+                    listing.flush()
+                    proc = subprocess.run(
+                        [pytesseract.pytesseract.tesseract_cmd, listing.name, '-',
+                         '-c', f'page_separator={OCR_PAGE_SEPARATOR}'],
+                        capture_output=True, check=True)
+                texts = proc.stdout.decode('utf-8', errors='ignore').split(OCR_PAGE_SEPARATOR)
+                # One page per image plus whatever follows the last separator
+                if len(texts) == len(paths) + 1:
+                    return [text[:2000] for text in texts[:-1]]
+            except (OSError, subprocess.SubprocessError):
+                pass
+        # Older tesseract, or an image it skipped: fall back to one at a time
+        return [_extract_image_text(path) for path in paths]
 
 
 class FileCategorizer:
@@ -175,33 +390,48 @@ class FileCategorizer:
     RECEIPT_PATTERNS = ['receipt', 'invoice', 'bill', 'payment', 'order', 'purchase',
                        'transaction', 'total', 'tax', 'subtotal', 'amount due']
     
+    _is_screenshot_name = staticmethod(_substring_matcher(SCREENSHOT_PATTERNS))
+    _is_receipt_text = staticmethod(_substring_matcher(RECEIPT_PATTERNS))
+    
     def __init__(self):
         self.extractor = ContentExtractor()
+        self._ext_to_category = {ext: category
+                                 for category, extensions in self.CATEGORIES.items()
+                                 for ext in extensions}
+        self._image_exts = frozenset(self.CATEGORIES['Images'])
+        self._code_exts = frozenset(['.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs'])
     
     def categorize(self, file_info: FileInfo) -> str:
         """Determine the category for a file."""
-        path = file_info.path
+        return (self.categorize_metadata_only(file_info)
+                or self.categorize_with_text(file_info))
+    
+    def categorize_metadata_only(self, file_info: FileInfo) -> Optional[str]:
+        """Categorize by name, extension and MIME type alone.
+        
+        Returns None when the extracted text decides the category.
+        """
         ext = file_info.extension.lower()
-        name_lower = path.name.lower()
+        name_lower = file_info.path.name.lower()
         
         # Check for screenshots by name pattern
-        if any(pattern in name_lower for pattern in self.SCREENSHOT_PATTERNS):
+        if self._is_screenshot_name(name_lower):
             return 'Screenshots'
         
-        # Check if it's an image that might be a receipt
-        if ext in self.CATEGORIES['Images']:
-            text = file_info.extracted_text or ''
-            text_lower = text.lower()
-            if any(pattern in text_lower for pattern in self.RECEIPT_PATTERNS):
-                return 'Receipts'
+        return self._categorize_by_type(ext, file_info.mime_type)
+    
+    def _categorize_by_type(self, ext: str, mime: str) -> Optional[str]:
+        """Categorize a non-screenshot by lowercase extension and MIME type."""
+        # Images tesseract can read might be receipts; other images can't
+        if ext in self._image_exts:
+            return None if mime in OCR_MIME_TYPES else 'Images'
         
         # Check by extension
-        for category, extensions in self.CATEGORIES.items():
-            if ext in extensions:
-                return category
+        category = self._ext_to_category.get(ext)
+        if category:
+            return category
         
         # Check by MIME type
-        mime = file_info.mime_type
         if mime:
             if mime.startswith('image/'):
                 return 'Images'
@@ -210,31 +440,42 @@ class FileCategorizer:
             elif mime.startswith('audio/'):
                 return 'Audio'
             elif mime == 'application/pdf':
-                # Check if PDF is a receipt
-                text = file_info.extracted_text or ''
-                if any(pattern in text.lower() for pattern in self.RECEIPT_PATTERNS):
-                    return 'Receipts'
-                return 'Documents'
+                # PDFs might be receipts
+                return None
             elif mime.startswith('text/'):
                 # Check if it's code
-                if ext in ['.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs']:
+                if ext in self._code_exts:
                     return 'Code'
                 return 'Documents'
         
         # Default fallback
         return 'Miscellaneous'
+    
+    def categorize_with_text(self, file_info: FileInfo) -> str:
+        """Categorize an image or PDF by its extracted text."""
+        text = file_info.extracted_text or ''
+        if self._is_receipt_text(text.lower()):
+            return 'Receipts'
+        if file_info.extension.lower() in self._image_exts:
+            return 'Images'
+        return 'Documents'
 
 
 class FileOrganizer:
     """Main organizer class that watches and organizes files."""
     
-    def __init__(self, source_dir: Path, dry_run: bool = False):
+    def __init__(self, source_dir: Path, dry_run: bool = False,
+                 jobs: Optional[int] = None):
         self.source_dir = Path(source_dir).expanduser().resolve()
         self.dry_run = dry_run
+        self.jobs = jobs or os.cpu_count() or 1
         self.categorizer = FileCategorizer()
-        self.log_file = self.source_dir / '.organizer.log.json'
+        self.log_file = self.source_dir / '.organizer.log.jsonl'
+        self.hash_cache_file = self.source_dir / '.organizer.hashcache.json'
         self.ignored_patterns = [
             '.organizer.log.json',
+            '.organizer.log.jsonl',
+            '.organizer.hashcache.json',
             '.DS_Store',
             'Thumbs.db',
             '.localized',
@@ -249,73 +490,216 @@ class FileOrganizer:
             '*.part',
             '*.crdownload',
         ]
-        self.history: List[dict] = self._load_history()
+        # Exact names are a set lookup; globs share one compiled regex
+        self._ignored_names = frozenset(p for p in self.ignored_patterns
+                                        if not any(c in p for c in '*?['))
+        self._ignored_re = re.compile('|'.join(f'(?:{translate(p)})'
+                                               for p in self.ignored_patterns))
+        self.history: Deque[dict] = deque(self._load_history(), maxlen=HISTORY_LIMIT)
+        self._log_fp = None
+        self._unflushed = 0
+        self._created_dirs: Set[Path] = set()
+        self._hash_cache: Dict[str, str] = self._load_hash_cache()
+        self._hash_cache_dirty = False
+        atexit.register(self._save_hash_cache)
     
     def _load_history(self) -> List[dict]:
-        """Load organization history."""
+        """Load the most recent organization history."""
+        history = []
         if self.log_file.exists():
             try:
-                with open(self.log_file, 'r') as f:
-                    return json.load(f)
+                with open(self.log_file, 'rb') as f:
+                    for line in deque(f, maxlen=HISTORY_LIMIT):
+                        history.append(json.loads(line))
             except Exception:
                 pass
-        return []
+        return history
+    
+    def _append_history(self, record: dict):
+        """Append a record to the history log, flushing periodically."""
+        self.history.append(record)
+        try:
+            if self._log_fp is None:
+                self._log_fp = open(self.log_file, 'ab', buffering=1 << 16)
+                atexit.register(self._flush_history)
+            if HAS_ORJSON:
+                line = orjson.dumps(record)
+            else:
+                line = json.dumps(record, separators=(',', ':')).encode()
+            self._log_fp.write(line + b'\n')
+            self._unflushed += 1
+        except Exception as e:
+            print(f"Warning: Could not save history: {e}")
+            return
+        if self._unflushed >= LOG_FLUSH_EVERY:
+            self._flush_history()
     
-    def _save_history(self):
-        """Save organization history."""
+    def _flush_history(self):
+        """Write out buffered history; rotate an oversized log."""
+        if self._log_fp is None or not self._unflushed:
+            return
         try:
-            with open(self.log_file, 'w') as f:
-                json.dump(self.history[-100:], f, indent=2)  # Keep last 100
+            self._log_fp.flush()
+            self._unflushed = 0
+            if self._log_fp.tell() > LOG_ROTATE_BYTES:
+                self._rotate_history()
         except Exception as e:
             print(f"Warning: Could not save history: {e}")
     
+    def _rotate_history(self):
+        """Trim the history log to its last HISTORY_LIMIT records."""
+        self._log_fp.close()
+        self._log_fp = None
+        with open(self.log_file, 'rb') as f:
+            lines = deque(f, maxlen=HISTORY_LIMIT)
+        tmp_file = self.log_file.with_name(self.log_file.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.writelines(lines)
+        os.replace(tmp_file, self.log_file)
+        self._log_fp = open(self.log_file, 'ab', buffering=1 << 16)
+    
+    def _load_hash_cache(self) -> Dict[str, str]:
+        """Load content hashes computed by previous runs."""
+        if self.hash_cache_file.exists():
+            try:
+                with open(self.hash_cache_file, 'r') as f:
+                    return json.load(f)
+            except Exception:
+                pass
+        return {}
+    
+    def _save_hash_cache(self):
+        """Save content hashes if any were added; dry runs write nothing."""
+        if self.dry_run or not self._hash_cache_dirty:
+            return
+        # Keep the most recently used entries
+        entries = list(self._hash_cache.items())[-HASH_CACHE_LIMIT:]
+        try:
+            with open(self.hash_cache_file, 'w') as f:
+                json.dump(dict(entries), f)
+            self._hash_cache_dirty = False
+        except Exception as e:
+            print(f"Warning: Could not save hash cache: {e}")
+    
     def _should_ignore(self, path: Path) -> bool:
         """Check if file should be ignored."""
         name = path.name
-        for pattern in self.ignored_patterns:
-            if fnmatch(name, pattern):
-                return True
+        if name in self._ignored_names or self._ignored_re.match(name):
+            return True
         # Ignore hidden files by default
-        if name.startswith('.') and name != '.organizer.log.json':
+        if name.startswith('.') and name != self.log_file.name:
             return True
         return False
     
-    def _compute_hash(self, path: Path) -> str:
+    def _prefetch(self, entry: os.DirEntry) -> Optional[Prefetched]:
+        """Stat and hash a directory entry ahead of analysis."""
+        try:
+            stat = entry.stat(follow_symlinks=False)
+        except OSError:
+            return None
+        return stat, self._compute_hash(Path(entry.path), stat)
+    
+    def _compute_hash(self, path: Path, stat: os.stat_result) -> str:
         """Compute a quick hash of file content."""
+        # An unchanged inode keeps its hash across runs and renames
+        key = f"{HASH_ALGORITHM}:{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+        cached = self._hash_cache.pop(key, None)
+        if cached:
+            # Reinsert so the entry counts as recently used when trimming
+            self._hash_cache[key] = cached
+            self._hash_cache_dirty = True
+            return cached
         try:
-            hasher = hashlib.blake2b(digest_size=16)
-            with open(path, 'rb') as f:
-                # Read first and last 8KB for speed
-                hasher.update(f.read(8192))
-                f.seek(-8192, 2)
-                hasher.update(f.read(8192))
-            return hasher.hexdigest()
-        except Exception:
+            try:
+                fd = os.open(path, os.O_RDONLY | O_NOATIME)
+            except PermissionError:
+                # O_NOATIME is refused on files we don't own
+                fd = os.open(path, os.O_RDONLY)
+            try:
+                # First and last 8KB only, for speed; small files in one read
+                if stat.st_size <= 2 * SAMPLE_SIZE:
+                    head, tail = os.read(fd, 2 * SAMPLE_SIZE), b''
+                else:
+                    head = os.read(fd, SAMPLE_SIZE)
+                    tail = os.pread(fd, SAMPLE_SIZE, stat.st_size - SAMPLE_SIZE)
+            finally:
+                os.close(fd)
+        except OSError:
             return hashlib.blake2b(path.name.encode()).hexdigest()[:16]
+        hasher = blake3() if HAS_BLAKE3 else hashlib.blake2b(digest_size=16)
+        hasher.update(head)
+        hasher.update(tail)
+        digest = hasher.hexdigest()[:32]
+        self._hash_cache[key] = digest
+        self._hash_cache_dirty = True
+        return digest
     
-    def _analyze_file(self, path: Path) -> FileInfo:
-        """Analyze a file and extract information."""
-        stat = path.stat()
-        mime_type, _ = mimetypes.guess_type(str(path))
-        
-        info = FileInfo(
+    def _describe_file(self, path: Path, prefetched: Optional[Prefetched] = None) -> FileInfo:
+        """Gather a file's metadata and content hash."""
+        if prefetched is None:
+            stat = path.stat()
+            content_hash = self._compute_hash(path, stat)
+        else:
+            stat, content_hash = prefetched
+        return FileInfo(
             path=path,
             size=stat.st_size,
-            mime_type=mime_type or 'application/octet-stream',
+            mime_type=_guess_mime_type(path.suffix.lower()),
             extension=path.suffix,
-            created=datetime.fromtimestamp(stat.st_ctime),
-            modified=datetime.fromtimestamp(stat.st_mtime),
-            content_hash=self._compute_hash(path),
+            created=stat.st_ctime,
+            modified=stat.st_mtime,
+            content_hash=content_hash,
         )
+    
+    def _categorize_by_content(self, info: FileInfo) -> FileInfo:
+        """Extract a file's content and categorize it by that."""
+        info.extracted_text = self.categorizer.extractor.extract(info.path, info.mime_type)
+        info.category = self.categorizer.categorize_with_text(info)
+        return info
+    
+    def _analyze_file(self, path: Path, prefetched: Optional[Prefetched] = None) -> FileInfo:
+        """Analyze a file and extract information."""
+        info = self._describe_file(path, prefetched)
         
-        # Extract content for analysis
-        info.extracted_text = self.categorizer.extractor.extract(path, info.mime_type)
-        
-        # Determine category
-        info.category = self.categorizer.categorize(info)
+        # Determine category, extracting content (OCR, PDF parsing) only
+        # when the name and type alone can't decide it
+        info.category = self.categorizer.categorize_metadata_only(info)
+        if info.category is None:
+            self._categorize_by_content(info)
         
         return info
     
+    def _categorize_all(self, infos: List[FileInfo]):
+        """Categorize a batch of files, extracting content only where needed."""
+        # Undecided images are OCR'd in bulk; anything else still undecided
+        # (a PDF known only by its MIME type) is extracted one at a time
+        images = []
+        for info in infos:
+            info.category = self.categorizer.categorize_metadata_only(info)
+            if info.category is None:
+                if info.mime_type in OCR_MIME_TYPES:
+                    images.append(info)
+                else:
+                    self._categorize_by_content(info)
+        self._ocr_images(images)
+    
+    def _ocr_images(self, infos: List[FileInfo]):
+        """OCR and categorize images whose category depends on their text."""
+        if not infos:
+            return
+        
+        # One tesseract process per job rather than one per image
+        extractor = self.categorizer.extractor
+        chunks = [infos[i::self.jobs] for i in range(min(self.jobs, len(infos)))]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            results = pool.map(
+                lambda chunk: extractor.extract_image_texts([info.path for info in chunk]),
+                chunks)
+            for chunk, texts in zip(chunks, results):
+                for info, text in zip(chunk, texts):
+                    info.extracted_text = text
+                    info.category = self.categorizer.categorize_with_text(info)
+    
     def _get_destination(self, file_info: FileInfo) -> Path:
         """Get the destination path for a file."""
         category = file_info.category or 'Miscellaneous'
@@ -333,6 +717,41 @@ class FileOrganizer:
         
         return dest_path
     
+    def _claim_destination(self, file_info: FileInfo) -> Path:
+        """Atomically create an empty placeholder at a free destination path."""
+        dest_dir = self.source_dir / (file_info.category or 'Miscellaneous')
+        dest_path = dest_dir / file_info.path.name
+        counter = 1
+        stem = file_info.path.stem
+        suffix = file_info.path.suffix
+        
+        # O_EXCL both probes and claims the name, so nothing else can take
+        # it between picking a name and moving the file there
+        while True:
+            try:
+                os.close(os.open(dest_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+                return dest_path
+            except FileExistsError:
+                dest_path = dest_dir / f"{stem}_{counter:03d}{suffix}"
+                counter += 1
+    
+    def _is_duplicate(self, file_info: FileInfo, other: Path) -> bool:
+        """Check whether another file has exactly the same content."""
+        try:
+            stat = other.lstat()
+            # A symlink, or another name for this very file, is not a second
+            # copy; treating it as one would delete the only copy
+            if (not S_ISREG(stat.st_mode)
+                    or os.path.samestat(stat, os.stat(file_info.path))):
+                return False
+            # Size and sampled hash rule most files out before a full compare
+            return (stat.st_size == file_info.size
+                    and self._compute_hash(other, stat) == file_info.content_hash
+                    and filecmp.cmp(file_info.path, other, shallow=False))
+        except OSError:
+            # Unreadable or vanished: not provably the same
+            return False
+    
     def organize_file(self, path: Path) -> Optional[dict]:
         """Organize a single file."""
         if not path.exists():
@@ -343,26 +762,70 @@ class FileOrganizer:
         
         # Analyze the file
         file_info = self._analyze_file(path)
+        record = self._move_file(file_info)
+        if record and not self.dry_run:
+            self._flush_history()
+        return record
+    
+    def _move_file(self, file_info: FileInfo) -> Optional[dict]:
+        """Move an analyzed file into its category folder."""
+        path = file_info.path
         
         # Skip if already in correct category folder
         current_parent = path.parent.name
         if current_parent == file_info.category:
             return None
         
-        # Get destination
-        dest_path = self._get_destination(file_info)
+        dest_dir = self.source_dir / (file_info.category or 'Miscellaneous')
         
-        # Create category directory
-        if not self.dry_run:
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+        # The same file is already there under its name: drop this copy
+        existing = dest_dir / path.name
+        if self._is_duplicate(file_info, existing):
+            action = 'deduplicated'
+            dest_path = existing
+            if self.dry_run:
+                print(f"[DRY RUN] Would remove duplicate: {path.name} (already in {file_info.category}/)")
+            else:
+                try:
+                    path.unlink()
+                    print(f"Removed duplicate: {path.name} (already in {file_info.category}/)")
+                except Exception as e:
+                    print(f"Error removing {path.name}: {e}")
+                    return None
         
         # Move the file
-        action = 'moved'
-        if self.dry_run:
+        elif self.dry_run:
+            action = 'moved'
+            dest_path = self._get_destination(file_info)
             print(f"[DRY RUN] Would move: {path.name} -> {file_info.category}/")
         else:
+            action = 'moved'
+            
+            # Create category directory, once per run
+            if dest_dir not in self._created_dirs:
+                dest_dir.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(dest_dir)
+            
             try:
-                shutil.move(str(path), str(dest_path))
+                try:
+                    dest_path = self._claim_destination(file_info)
+                except FileNotFoundError:
+                    # The folder was removed after we created it (say, during
+                    # a long watch session); make it again and retry once
+                    self._created_dirs.discard(dest_dir)
+                    dest_dir.mkdir(parents=True, exist_ok=True)
+                    self._created_dirs.add(dest_dir)
+                    dest_path = self._claim_destination(file_info)
+                try:
+                    # Category folders live under source_dir, so this is
+                    # normally a same-filesystem rename over the placeholder;
+                    # os.replace, since os.rename won't overwrite on Windows
+                    os.replace(path, dest_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        dest_path.unlink(missing_ok=True)
+                        raise
+                    shutil.move(str(path), str(dest_path))
                 print(f"Moved: {path.name} -> {file_info.category}/")
             except Exception as e:
                 print(f"Error moving {path.name}: {e}")
@@ -380,8 +843,7 @@ class FileOrganizer:
         }
         
         if not self.dry_run:
-            self.history.append(record)
-            self._save_history()
+            self._append_history(record)
         
         return record
     
@@ -397,11 +859,14 @@ class FileOrganizer:
         print(f"Mode: {'DRY RUN' if self.dry_run else 'LIVE'}")
         print("-" * 50)
         
-        # Get all files (not in category subdirectories)
-        files = []
-        for item in self.source_dir.iterdir():
-            if item.is_file() and not self._should_ignore(item):
-                files.append(item)
+        # Get all files (not in category subdirectories). DirEntry answers
+        # is_file() from the directory listing and caches its stat result.
+        entries = []
+        with os.scandir(self.source_dir) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False) and not self._should_ignore(entry):
+                    entries.append(entry)
+        files = [Path(entry.path) for entry in entries]
         
         if not files:
             print("No files to organize.")
@@ -409,10 +874,27 @@ class FileOrganizer:
         
         print(f"Found {len(files)} files to process...\n")
         
-        for file_path in files:
-            result = self.organize_file(file_path)
-            if result:
-                results.append(result)
+        try:
+            # Stat and hash files in batches so the reads overlap in the kernel
+            # instead of paying open/stat/seek/read latency one file at a time.
+            # Hashing here, in this process, also keeps the hash cache current.
+            with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as pool:
+                for start in range(0, len(files), PREFETCH_BATCH):
+                    batch = files[start:start + PREFETCH_BATCH]
+                    prefetched = pool.map(self._prefetch,
+                                          entries[start:start + PREFETCH_BATCH])
+                    # Files that vanished since the listing are skipped
+                    infos = [self._describe_file(path, pre)
+                             for path, pre in zip(batch, prefetched) if pre]
+                    self._categorize_all(infos)
+                    for file_info in infos:
+                        result = self._move_file(file_info)
+                        if result:
+                            results.append(result)
+        finally:
+            if not self.dry_run:
+                self._flush_history()
+                self._save_hash_cache()
         
         print(f"\n{'-' * 50}")
         print(f"Organized {len(results)} files")
@@ -443,15 +925,11 @@ class FileOrganizer:
         class OrganizerHandler(FileSystemEventHandler):
             def __init__(self, organizer):
                 self.organizer = organizer
-                self.processed = set()
             
             def on_created(self, event):
                 if event.is_directory:
                     return
-                # Debounce: wait a moment for file to be fully written
-                import time
-                time.sleep(0.5)
-                self.organizer.organize_file(Path(event.src_path))
+                self.organizer._event_q.put((Path(event.src_path), time.monotonic()))
             
             def on_modified(self, event):
                 if event.is_directory:
@@ -459,13 +937,16 @@ class FileOrganizer:
                 # Only process if it's a new file in root
                 path = Path(event.src_path)
                 if path.parent == self.organizer.source_dir:
-                    import time
-                    time.sleep(0.5)
-                    self.organizer.organize_file(path)
+                    self.organizer._event_q.put((path, time.monotonic()))
         
         print(f"Watching: {self.source_dir}")
         print("Press Ctrl+C to stop\n")
         
+        # Handlers only enqueue; a single worker debounces and organizes
+        self._event_q = queue.Queue()
+        worker = threading.Thread(target=self._drain_events, daemon=True)
+        worker.start()
+        
         event_handler = OrganizerHandler(self)
         observer = Observer()
         observer.schedule(event_handler, str(self.source_dir), recursive=False)
@@ -473,13 +954,49 @@ class FileOrganizer:
         
         try:
             while True:
-                import time
                 time.sleep(1)
         except KeyboardInterrupt:
             observer.stop()
             print("\nStopped watching.")
         
         observer.join()
+        self._event_q.put((None, 0.0))
+        worker.join()
+    
+    def _drain_events(self):
+        """Organize queued paths once they've been quiet for DEBOUNCE_SECONDS."""
+        # Debounce: wait for files to be fully written, and collapse bursts
+        # of events on the same path into one organize_file call
+        last_seen: Dict[Path, float] = {}
+        while True:
+            timeout = None
+            if last_seen:
+                due = min(last_seen.values()) + DEBOUNCE_SECONDS
+                timeout = max(0.0, due - time.monotonic())
+            try:
+                path, seen = self._event_q.get(timeout=timeout)
+                if path is None:
+                    return
+                last_seen[path] = seen
+            except queue.Empty:
+                pass
+            
+            now = time.monotonic()
+            for path, seen in list(last_seen.items()):
+                if now - seen >= DEBOUNCE_SECONDS:
+                    del last_seen[path]
+                    try:
+                        self.organize_file(path)
+                    except Exception as e:
+                        print(f"Error organizing {path.name}: {e}")
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for a count that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
 
 
 def main():
@@ -493,10 +1010,12 @@ def main():
                        help='Watch directory for new files')
     parser.add_argument('--undo', action='store_true',
                        help='Undo last organization (restore files to root)')
+    parser.add_argument('--jobs', '-j', type=_positive_int, default=None, metavar='N',
+                       help='Tesseract processes to run at once for OCR (default: CPU count)')
     
     args = parser.parse_args()
     
-    organizer = FileOrganizer(args.directory, dry_run=args.dry_run)
+    organizer = FileOrganizer(args.directory, dry_run=args.dry_run, jobs=args.jobs)
     
     if args.undo:
         print("Undo functionality not yet implemented.")
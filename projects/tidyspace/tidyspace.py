@@ -16,11 +16,16 @@ import os
 import sys
 import shutil
 import argparse
+import functools
+import hashlib
 import json
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional, Iterator
 import re
 
 
@@ -47,9 +52,75 @@ DEFAULT_CONFIG = {
     ],
     "global_exclusions": [".DS_Store", "Thumbs.db", ".localized"],
     "dry_run": False,
-    "log_file": "~/.local/share/tidyspace/log.json"
+    "log_file": "~/.local/share/tidyspace/log.jsonl"
 }
 
+# Log entries kept when the log is trimmed, and the size that triggers a trim
+LOG_MAX_ENTRIES = 1000
+LOG_ROTATE_BYTES = 1 << 20
+
+# Cross-device moves copied concurrently (solid-state disks only)
+COPY_WORKERS = 4
+
+# Directories a recursive scan never descends into
+SKIP_DIRS = {"node_modules", ".git", ".cache"}
+
+# Bytes read from each same-size file before committing to a full hash
+PREFIX_HASH_BYTES = 4096
+
+# Read size when hashing whole files without hashlib.file_digest
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def _prefix_digest(path: Path) -> bytes:
+    """BLAKE2b of the first PREFIX_HASH_BYTES of a file."""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(PREFIX_HASH_BYTES)).digest()
+
+
+def _full_digest(path: Path) -> bytes:
+    """BLAKE2b of a whole file."""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'blake2b').digest()
+        # Python < 3.11
+        hasher = hashlib.blake2b()
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            hasher.update(chunk)
+        return hasher.digest()
+
+
+def _scandir_recursive(path: Path, skip_dirs=SKIP_DIRS) -> Iterator[os.DirEntry]:
+    """
+    Yield a DirEntry for every regular file under path. Directories named
+    in skip_dirs are pruned, and symlinks are never followed.
+    """
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
+
+
+@dataclass
+class FileInfo:
+    """A file found during analysis, with its metadata read once."""
+    path: Path
+    name: str
+    name_lower: str
+    ext_lower: str
+    size: int
+    mtime: float
+    age_days: float
+    category: str
+
 
 class FileCategorizer:
     """Categorizes files based on patterns and metadata."""
@@ -62,33 +133,32 @@ class FileCategorizer:
     VIDEO_EXTS = {'.mp4', '.mov', '.avi', '.mkv', '.flv', '.wmv'}
     AUDIO_EXTS = {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a'}
     
+    EXT_TO_CATEGORY = {
+        ext: category
+        for exts, category in (
+            (IMAGE_EXTS, "images"),
+            (DOC_EXTS, "documents"),
+            (ARCHIVE_EXTS, "archives"),
+            (INSTALLER_EXTS, "installers"),
+            (CODE_EXTS, "code"),
+            (VIDEO_EXTS, "videos"),
+            (AUDIO_EXTS, "audio"),
+        )
+        for ext in exts
+    }
+    
+    # All screenshot name patterns, matched in one pass
+    _SCREENSHOT_RE = re.compile(r'screenshot|screen shot|screencapture|capture|img_')
+    
     @classmethod
-    def get_category(cls, filepath: Path) -> str:
-        """Determine file category based on extension."""
-        ext = filepath.suffix.lower()
-        if ext in cls.IMAGE_EXTS:
-            return "images"
-        elif ext in cls.DOC_EXTS:
-            return "documents"
-        elif ext in cls.ARCHIVE_EXTS:
-            return "archives"
-        elif ext in cls.INSTALLER_EXTS:
-            return "installers"
-        elif ext in cls.CODE_EXTS:
-            return "code"
-        elif ext in cls.VIDEO_EXTS:
-            return "videos"
-        elif ext in cls.AUDIO_EXTS:
-            return "audio"
-        else:
-            return "other"
+    def get_category(cls, ext_lower: str) -> str:
+        """Determine file category from a lowercased extension."""
+        return cls.EXT_TO_CATEGORY.get(ext_lower, "other")
     
     @classmethod
-    def is_screenshot(cls, filepath: Path) -> bool:
-        """Check if file appears to be a screenshot."""
-        name_lower = filepath.name.lower()
-        screenshot_patterns = ['screenshot', 'screen shot', 'screencapture', 'capture', 'img_']
-        return any(pattern in name_lower for pattern in screenshot_patterns)
+    def is_screenshot(cls, name_lower: str) -> bool:
+        """Check if a lowercased file name looks like a screenshot."""
+        return cls._SCREENSHOT_RE.search(name_lower) is not None
 
 
 class TidySpace:
@@ -99,8 +169,40 @@ class TidySpace:
         self.dry_run = dry_run
         self.actions_log: List[Dict] = []
         self.stats = defaultdict(int)
+        # One reference time for the whole run
+        self._now_ts = time.time()
+        self._now_dt = datetime.fromtimestamp(self._now_ts)
+        
+        # Destinations used by suggest_action, expanded once
+        year = str(self._now_dt.year)
+        month = f"{self._now_dt.month:02d}"
+        self._home = Path(os.path.expanduser("~"))
+        self._screenshot_dest = self._home / "Pictures" / "Screenshots" / year / month
+        self._archive_dest = self._home / "Archives" / "Downloads" / year
+        self._image_dest = self._home / "Pictures" / "Downloads" / year / month
+        self._document_dest = self._home / "Documents" / "Downloaded"
+        self._oldfiles_dest = self._home / "Archives" / "OldFiles" / year
         
-    def expand_path(self, path: str) -> Path:
+        # suggest_action rules, checked in order after the screenshot check:
+        # (category or None for any, older than N days, action, destination, reason)
+        self._rules = [
+            ("installers", 30, "delete", None, "Old installer"),
+            ("archives", 60, "move", self._archive_dest, "Old archive"),
+            ("images", 30, "move", self._image_dest, "Old image"),
+            ("documents", 90, "move", self._document_dest, "Old document"),
+            (None, 180, "move", self._oldfiles_dest, "Very old file"),
+        ]
+        
+        # Directories already created this run, and st_dev per directory
+        self._created_dirs: set = set()
+        self._dir_devices: Dict[Path, int] = {}
+        # Names present in each destination, listed once on first use
+        self._dest_names: Dict[Path, set] = {}
+        self._rotational: Dict[int, bool] = {}
+        
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def expand_path(path: str) -> Path:
         """Expand ~ and environment variables in path."""
         return Path(os.path.expanduser(os.path.expandvars(path)))
     
@@ -109,69 +211,78 @@ class TidySpace:
         exclusions = self.config.get("global_exclusions", [])
         return filepath.name in exclusions
     
-    def get_file_age_days(self, filepath: Path) -> float:
-        """Get file age in days."""
-        try:
-            stat = filepath.stat()
-            mtime = datetime.fromtimestamp(stat.st_mtime)
-            return (datetime.now() - mtime).total_seconds() / 86400
-        except (OSError, FileNotFoundError):
-            return 0
-    
     def find_duplicates(self, directory: Path) -> List[List[Path]]:
-        """Find potential duplicate files by size and name similarity."""
+        """Find duplicate files in a directory."""
         files_by_size = defaultdict(list)
         
-        for filepath in directory.iterdir():
-            if filepath.is_file() and not self.should_exclude(filepath):
-                try:
-                    size = filepath.stat().st_size
-                    files_by_size[size].append(filepath)
-                except OSError:
-                    continue
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False) and not self.should_exclude(entry):
+                    try:
+                        size = entry.stat(follow_symlinks=False).st_size
+                        files_by_size[size].append(Path(entry.path))
+                    except OSError:
+                        continue
         
-        # Groups with same size are potential duplicates
-        duplicates = [group for group in files_by_size.values() if len(group) > 1]
+        return self._duplicates_by_size(files_by_size)
+    
+    def _duplicates_by_size(self, files_by_size: Dict[int, List[Path]]) -> List[List[Path]]:
+        """
+        Confirm duplicates in stages: files already grouped by size are split
+        by a hash of the first 4 KB, then by a hash of the full content. Each
+        stage only looks at files that still collide after the previous one.
+        """
+        duplicates = []
+        needs_full_hash = []
+        for size, group in files_by_size.items():
+            if len(group) < 2:
+                continue
+            for subgroup in self._group_by_digest(group, _prefix_digest):
+                # The prefix already covered the whole file
+                if size <= PREFIX_HASH_BYTES:
+                    duplicates.append(subgroup)
+                else:
+                    needs_full_hash.append(subgroup)
+        
+        if needs_full_hash:
+            # hashlib releases the GIL while hashing, so threads overlap
+            # both the reads and the hashing of different files
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+                futures = {path: pool.submit(_full_digest, path)
+                           for subgroup in needs_full_hash for path in subgroup}
+            for subgroup in needs_full_hash:
+                duplicates.extend(self._group_by_digest(
+                    subgroup, lambda path: futures[path].result()))
         return duplicates
     
-    def suggest_action(self, filepath: Path) -> Tuple[str, Optional[Path], str]:
+    @staticmethod
+    def _group_by_digest(paths: List[Path], digest) -> List[List[Path]]:
+        """Split paths by digest, keeping only groups with more than one file."""
+        groups = defaultdict(list)
+        for path in paths:
+            try:
+                groups[digest(path)].append(path)
+            except OSError:
+                continue
+        return [group for group in groups.values() if len(group) > 1]
+    
+    def suggest_action(self, info: FileInfo) -> Tuple[str, Optional[Path], str]:
         """
         Suggest an action for a file.
         Returns: (action, destination, reason)
         """
-        age_days = self.get_file_age_days(filepath)
-        category = FileCategorizer.get_category(filepath)
+        age_days = info.age_days
+        category = info.category
         
         # Screenshots get special handling
-        if FileCategorizer.is_screenshot(filepath):
-            dest = self.expand_path(f"~/Pictures/Screenshots/{datetime.now().year}/{datetime.now().month:02d}")
+        if FileCategorizer.is_screenshot(info.name_lower):
             if age_days > 7:
-                return ("move", dest, f"Screenshot older than 7 days")
+                return ("move", self._screenshot_dest, f"Screenshot older than 7 days")
             return ("keep", None, "Recent screenshot")
         
-        # Old installers are usually safe to delete
-        if category == "installers" and age_days > 30:
-            return ("delete", None, f"Old installer ({age_days:.0f} days)")
-        
-        # Archives older than 60 days
-        if category == "archives" and age_days > 60:
-            dest = self.expand_path(f"~/Archives/Downloads/{datetime.now().year}")
-            return ("move", dest, f"Old archive ({age_days:.0f} days)")
-        
-        # Images older than 30 days
-        if category == "images" and age_days > 30:
-            dest = self.expand_path(f"~/Pictures/Downloads/{datetime.now().year}/{datetime.now().month:02d}")
-            return ("move", dest, f"Old image ({age_days:.0f} days)")
-        
-        # Documents older than 90 days
-        if category == "documents" and age_days > 90:
-            dest = self.expand_path("~/Documents/Downloaded")
-            return ("move", dest, f"Old document ({age_days:.0f} days)")
-        
-        # Very old files go to archive
-        if age_days > 180:
-            dest = self.expand_path(f"~/Archives/OldFiles/{datetime.now().year}")
-            return ("move", dest, f"Very old file ({age_days:.0f} days)")
+        for rule_category, min_age, action, dest, reason in self._rules:
+            if age_days > min_age and (rule_category is None or rule_category == category):
+                return (action, dest, f"{reason} ({age_days:.0f} days)")
         
         return ("keep", None, "File is recent or doesn't match cleanup rules")
     
@@ -187,27 +298,106 @@ class TidySpace:
             })
             return True
         
+        return self._record_action(filepath, action, destination,
+                                   self._apply_action(filepath, action, destination))
+    
+    def _execute_actions(self, items: List[Dict]):
+        """
+        Execute suggested actions in order. Cross-device copies between
+        solid-state disks overlap in a thread pool; results are still
+        recorded in the original order.
+        """
+        if self.dry_run:
+            for item in items:
+                self.execute_action(item["path"], item["action"], item["destination"])
+            return
+        
+        # Threads only copy data; names, stats and the log stay on this thread
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+            results = [self._apply_action(item["path"], item["action"], item["destination"], pool)
+                       for item in items]
+        for item, result in zip(items, results):
+            if isinstance(result, Future):
+                result = result.exception()
+            self._record_action(item["path"], item["action"], item["destination"], result)
+    
+    def _apply_action(self, filepath: Path, action: str, destination: Optional[Path],
+                      pool: Optional[ThreadPoolExecutor] = None):
+        """
+        Perform an action. Returns None on success or the exception on
+        failure; a cross-device move handed to pool returns its Future.
+        """
         try:
             if action == "delete":
                 filepath.unlink()
-                self.stats["deleted"] += 1
                 
             elif action == "move" and destination:
-                destination.mkdir(parents=True, exist_ok=True)
-                dest_path = destination / filepath.name
-                
-                # Handle name collisions
-                counter = 1
-                original_dest = dest_path
-                while dest_path.exists():
-                    stem = original_dest.stem
-                    suffix = original_dest.suffix
-                    dest_path = destination / f"{stem}_{counter}{suffix}"
-                    counter += 1
+                dest_path = self._claim_dest_path(filepath, destination)
+                src_dev = self._device_of(filepath.parent)
+                dest_dev = self._device_of(destination)
                 
+                same_device = src_dev == dest_dev
+                if (not same_device and pool is not None
+                        and not self._is_rotational(src_dev)
+                        and not self._is_rotational(dest_dev)):
+                    return pool.submit(self._move_to_claimed, filepath, dest_path, same_device)
+                self._move_to_claimed(filepath, dest_path, same_device)
+        except Exception as e:
+            return e
+        return None
+    
+    @staticmethod
+    def _move_to_claimed(filepath: Path, dest_path: Path, same_device: bool):
+        """Move a file over its claimed placeholder, removing the placeholder on failure."""
+        try:
+            # Same filesystem: one rename() instead of shutil's checks;
+            # os.replace, since os.rename won't overwrite on Windows
+            if same_device:
+                os.replace(filepath, dest_path)
+            else:
                 shutil.move(str(filepath), str(dest_path))
+        except BaseException:
+            dest_path.unlink(missing_ok=True)
+            raise
+    
+    def _claim_dest_path(self, filepath: Path, destination: Path) -> Path:
+        """
+        Create destination if needed and claim a free name for filepath in
+        it by creating an empty placeholder file there.
+        """
+        if destination not in self._created_dirs:
+            destination.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(destination)
+        names = self._dest_names.get(destination)
+        if names is None:
+            with os.scandir(destination) as it:
+                names = self._dest_names[destination] = {entry.name for entry in it}
+        
+        # Handle name collisions. The listing is only a first guess: it may
+        # be stale, or miss a name differing only in case on a case-insensitive
+        # filesystem. O_EXCL confirms the name is free and claims it at once.
+        name = filepath.name
+        counter = 1
+        while True:
+            if name not in names:
+                names.add(name)
+                try:
+                    os.close(os.open(destination / name,
+                                     os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+                    return destination / name
+                except FileExistsError:
+                    pass
+            name = f"{filepath.stem}_{counter}{filepath.suffix}"
+            counter += 1
+    
+    def _record_action(self, filepath: Path, action: str, destination: Optional[Path],
+                       error: Optional[Exception]) -> bool:
+        """Update stats and the action log for a finished action."""
+        if error is None:
+            if action == "delete":
+                self.stats["deleted"] += 1
+            elif action == "move" and destination:
                 self.stats["moved"] += 1
-                
             self.actions_log.append({
                 "timestamp": datetime.now().isoformat(),
                 "action": action,
@@ -216,24 +406,49 @@ class TidySpace:
                 "success": True
             })
             return True
-            
-        except Exception as e:
-            self.actions_log.append({
-                "timestamp": datetime.now().isoformat(),
-                "action": action,
-                "source": str(filepath),
-                "error": str(e),
-                "success": False
-            })
-            self.stats["errors"] += 1
-            return False
+        
+        self.actions_log.append({
+            "timestamp": datetime.now().isoformat(),
+            "action": action,
+            "source": str(filepath),
+            "error": str(error),
+            "success": False
+        })
+        self.stats["errors"] += 1
+        return False
+    
+    def _device_of(self, directory: Path) -> int:
+        """Return the st_dev of a directory, stat-ing it once per run."""
+        dev = self._dir_devices.get(directory)
+        if dev is None:
+            dev = self._dir_devices[directory] = directory.stat().st_dev
+        return dev
     
-    def analyze_directory(self, directory: Path) -> Dict:
-        """Analyze a directory and return findings."""
+    def _is_rotational(self, dev: int) -> bool:
+        """Best-effort check for a spinning disk; unknown devices count as solid-state."""
+        rotational = self._rotational.get(dev)
+        if rotational is None:
+            rotational = False
+            try:
+                base = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+                # Partitions keep their queue settings on the parent disk
+                for queue in (f"{base}/queue/rotational", f"{base}/../queue/rotational"):
+                    if os.path.exists(queue):
+                        with open(queue) as f:
+                            rotational = f.read().strip() == "1"
+                        break
+            except (OSError, AttributeError):
+                pass
+            self._rotational[dev] = rotational
+        return rotational
+    
+    def analyze_directory(self, directory: Path, recursive: bool = False) -> Dict:
+        """Analyze a directory (and its subdirectories if recursive) and return findings."""
+        files_by_size = defaultdict(list)
         findings = {
             "total_files": 0,
             "total_size": 0,
-            "by_category": defaultdict(lambda: {"count": 0, "size": 0}),
+            "by_category": {},
             "old_files": [],
             "duplicates": [],
             "suggested_actions": []
@@ -242,66 +457,89 @@ class TidySpace:
         if not directory.exists():
             return findings
         
-        for filepath in directory.iterdir():
-            if not filepath.is_file() or self.should_exclude(filepath):
-                continue
-            
+        # DirEntry answers is_file() from the directory listing and caches
+        # its stat result, saving syscalls over Path.iterdir()
+        if recursive:
+            entries = [entry for entry in _scandir_recursive(directory)
+                       if not self.should_exclude(entry)]
+        else:
+            with os.scandir(directory) as it:
+                entries = [entry for entry in it
+                           if entry.is_file(follow_symlinks=False)
+                           and not self.should_exclude(entry)]
+        
+        by_category = findings["by_category"]
+        for entry in entries:
             try:
-                stat = filepath.stat()
-                size = stat.st_size
-                age_days = (datetime.now() - datetime.fromtimestamp(stat.st_mtime)).total_seconds() / 86400
-                category = FileCategorizer.get_category(filepath)
-                
-                findings["total_files"] += 1
-                findings["total_size"] += size
-                findings["by_category"][category]["count"] += 1
-                findings["by_category"][category]["size"] += size
-                
-                if age_days > 30:
-                    findings["old_files"].append({
-                        "path": filepath,
-                        "age_days": age_days,
-                        "size": size
-                    })
-                
-                action, dest, reason = self.suggest_action(filepath)
-                if action != "keep":
-                    findings["suggested_actions"].append({
-                        "path": filepath,
-                        "action": action,
-                        "destination": dest,
-                        "reason": reason,
-                        "size": size
-                    })
-                    
+                stat = entry.stat(follow_symlinks=False)
             except OSError:
                 continue
+            filepath = Path(entry.path)
+            age_days = (self._now_ts - stat.st_mtime) / 86400.0
+            size = stat.st_size
+            # Lowercase once; both the category and screenshot checks use it
+            name_lower = entry.name.lower()
+            ext_lower = os.path.splitext(name_lower)[1]
+            category = FileCategorizer.get_category(ext_lower)
+            info = FileInfo(filepath, entry.name, name_lower, ext_lower,
+                            size, stat.st_mtime, age_days, category)
+            
+            findings["total_files"] += 1
+            findings["total_size"] += size
+            files_by_size[size].append(filepath)
+            totals = by_category.get(category)
+            if totals is None:
+                totals = by_category[category] = {"count": 0, "size": 0}
+            totals["count"] += 1
+            totals["size"] += size
+            
+            if age_days > 30:
+                findings["old_files"].append({
+                    "path": filepath,
+                    "age_days": age_days,
+                    "size": size
+                })
+            
+            action, dest, reason = self.suggest_action(info)
+            if action != "keep":
+                findings["suggested_actions"].append({
+                    "path": filepath,
+                    "action": action,
+                    "destination": dest,
+                    "reason": reason,
+                    "size": size
+                })
         
-        findings["duplicates"] = self.find_duplicates(directory)
+        # Duplicates come from the same scan instead of listing the directory again
+        findings["duplicates"] = self._duplicates_by_size(files_by_size)
         return findings
     
-    def clean_directory(self, directory: Path) -> Dict:
+    def clean_directory(self, directory: Path, recursive: bool = False) -> Dict:
         """Clean a single directory. Returns summary."""
-        print(f"\n📁 Cleaning: {directory}")
-        print("-" * 50)
+        # Collect the report and write it once instead of a print() per line
+        out = [f"\n📁 Cleaning: {directory}\n", "-" * 50 + "\n"]
         
-        findings = self.analyze_directory(directory)
+        findings = self.analyze_directory(directory, recursive)
         
         if findings["total_files"] == 0:
-            print("  Directory is empty or doesn't exist.")
+            out.append("  Directory is empty or doesn't exist.\n")
+            sys.stdout.write("".join(out))
             return findings
         
-        print(f"  Found {findings['total_files']} files ({self._format_size(findings['total_size'])})")
-        print(f"  Suggested actions: {len(findings['suggested_actions'])}")
+        out.append(f"  Found {findings['total_files']} files ({self._format_size(findings['total_size'])})\n")
+        out.append(f"  Suggested actions: {len(findings['suggested_actions'])}\n")
         
-        # Execute suggested actions
         for item in findings["suggested_actions"]:
             action_str = "🗑️  DELETE" if item["action"] == "delete" else f"📦 MOVE → {item['destination']}"
-            print(f"  {action_str}: {item['path'].name}")
-            print(f"     Reason: {item['reason']}")
-            
-            self.execute_action(item["path"], item["action"], item["destination"])
+            out.append(f"  {action_str}: {item['path'].name}\n")
+            out.append(f"     Reason: {item['reason']}\n")
+        
+        # Show the plan before carrying it out
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
         
+        # Execute suggested actions
+        self._execute_actions(findings["suggested_actions"])
         return findings
     
     def _format_size(self, size_bytes: int) -> str:
@@ -325,7 +563,7 @@ class TidySpace:
         
         for target in self.config.get("targets", []):
             path = self.expand_path(target["path"])
-            findings = self.clean_directory(path)
+            findings = self.clean_directory(path, target.get("recursive", False))
             all_findings.append({"path": str(path), "findings": findings})
         
         # Save log
@@ -349,27 +587,22 @@ class TidySpace:
         }
     
     def _save_log(self):
-        """Save action log to file."""
-        log_path = self.expand_path(self.config.get("log_file", "~/.local/share/tidyspace/log.json"))
+        """Append this run's actions to the JSON Lines log."""
+        log_path = self.expand_path(self.config.get("log_file", "~/.local/share/tidyspace/log.jsonl"))
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Load existing log
-        existing_log = []
-        if log_path.exists():
-            try:
-                with open(log_path) as f:
-                    existing_log = json.load(f)
-            except json.JSONDecodeError:
-                pass
-        
-        # Append new entries
-        existing_log.extend(self.actions_log)
-        
-        # Keep only last 1000 entries
-        existing_log = existing_log[-1000:]
+        with open(log_path, 'a') as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in self.actions_log)
+            size = f.tell()
         
-        with open(log_path, 'w') as f:
-            json.dump(existing_log, f, indent=2)
+        # Keep only the last LOG_MAX_ENTRIES entries once the log gets large
+        if size > LOG_ROTATE_BYTES:
+            with open(log_path) as f:
+                lines = deque(f, maxlen=LOG_MAX_ENTRIES)
+            tmp_path = log_path.with_name(log_path.name + ".tmp")
+            with open(tmp_path, 'w') as f:
+                f.writelines(lines)
+            os.replace(tmp_path, log_path)
 
 
 def main():